@@ -1,209 +1,381 @@
 import os
 import re
+import copy
 import json
+import functools
+import mmap
+
+try:
+    import re2  # Optional: google-re2
+except ImportError:
+    re2 = None
+
+_RE2_INLINE_FLAGS = ((re.MULTILINE, b'(?m)'), (re.DOTALL, b'(?s)'), (re.IGNORECASE, b'(?i)'))
+
+def _compile_linear(pattern, flags=0):
+    """
+    Compiles a bytes pattern with RE2 when google-re2 is installed, so matching runs in linear time.
+    Falls back to the standard re module if RE2 is unavailable or rejects the pattern.
+    """
+    if re2 is not None:
+        prefix = b''.join(inline for flag, inline in _RE2_INLINE_FLAGS if flags & flag)
+        try:
+            return re2.compile(prefix + pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+# Source files are scanned as raw bytes; only the captured fragments are decoded.
+_INTERFACE_RE = re.compile(rb'class\s+\w+\s*:\s*([^{]+)')
+_LINE_COMMENT_RE = re.compile(rb'//.*')
+_TYPES_RE = re.compile(rb'TypeNames\s*=\s*new\s*List<string>\(\)\s*{([^}]+)}')
+# Class headers and the framework version are tokenized in one pass; both alternatives are
+# ^-anchored and end on their own line's brace or semicolon, so neither can hide the other.
+# match.lastgroup names the alternative that matched.
+_SOURCE_RE = re.compile(
+    rb'(?P<class_header>'
+    rb'^\s*(?:\[[^\]]+\]\s*)*'        # Optional attributes
+    rb'(?:public\s+|private\s+|protected\s+)?'  # Optional access modifier
+    rb'(?:partial\s+)?'                # Optional 'partial' keyword
+    rb'class\s+(?P<class_name>[A-Za-z_]\w*)'  # Class name
+    rb'(?:\s*:\s*(?P<class_bases>[^\{]+))?'  # Optional base classes
+    rb'\s*\{'                          # Opening brace
+    rb')'
+    rb'|(?P<version>^\s*MinimumEssentialsFrameworkVersion\s*=\s*"(?P<version_number>[^"]+)"\s*;)',
+    re.MULTILINE
+)
+_SOURCE_LITERALS = (b'class', b'MinimumEssentialsFrameworkVersion')
+# Kept out of _SOURCE_RE: the parameter span crosses newlines, so an unclosed signature
+# (e.g. in a wrapped comment) would swallow the class headers up to the next ')'
+_METHOD_RE = re.compile(rb'public\s+\w+\s+\w+\s*\([^)]*\)\s*')
+# The lazy type span makes this the one pattern prone to heavy backtracking
+_PROPERTY_RE = _compile_linear(
+    rb'^\s*'
+    rb'(?:\[[^\]]*\]\s*)*'              # Optional attributes
+    rb'(?:public|private|protected)\s+'  # Access modifier
+    rb'(?:static\s+|virtual\s+|override\s+|abstract\s+|readonly\s+)?'  # Optional modifiers
+    rb'([A-Za-z0-9_<>,\s\[\]\?]+?)\s+'     # Type
+    rb'([A-Za-z_]\w*)\s*'                # Property name
+    rb'\{[^}]*\}',                       # Property body
+    re.MULTILINE
+)
+_JSON_PROPERTY_RE = re.compile(rb'\[JsonProperty\("([^"]+)"\)\]')
+# No DOTALL: every variable span is a negated class, so none of them can run past its closing brace or quote
+_JOIN_RE = re.compile(
+    rb'\[JoinName\("(?P<join_name>[^"]+)"\)\]\s*'  # Match the [JoinName("...")] attribute
+    rb'public\s+JoinDataComplete\s+(?P<property_name>\w+)\s*=\s*'  # Match the property declaration
+    rb'new\s+JoinDataComplete\s*\('  # Match 'new JoinDataComplete('
+    rb'\s*new\s+JoinData\s*\{(?P<join_data>[^}]+)\}\s*,'  # Match 'new JoinData { ... },'
+    rb'\s*new\s+JoinMetadata\s*\{(?P<join_metadata>[^}]+)\}\s*'  # Match 'new JoinMetadata { ... }'
+    rb'\)'  # Match closing parenthesis of new JoinDataComplete
+)
+# Comments, verbatim/regular strings and char literals are consumed whole so braces inside them are never counted;
+# an unterminated comment or string runs to the end of the content or line instead of failing to match
+_BRACE_RE = re.compile(
+    rb'//[^\n]*'
+    rb'|/\*.*?(?:\*/|\Z)'
+    rb'|@"(?:[^"]|"")*"?'
+    rb'|"(?:[^"\\\n]|\\.)*"?'
+    rb"|'(?:[^'\\\n]|\\.)*'?"
+    rb'|(?P<open>\{)|(?P<close>\})',
+    re.DOTALL
+)
+_JOIN_NUMBER_RE = re.compile(rb'JoinNumber\s*=\s*(\d+)')
+# Both JoinMetadata fields in one alternation, dispatched on lastgroup
+_JOIN_METADATA_RE = re.compile(
+    rb'Description\s*=\s*"(?P<description>[^"]+)"'
+    rb'|JoinType\s*=\s*eJoinType\.(?P<join_type>\w+)'
+)
+
+_PRIMITIVE_SAMPLES = {
+    'int': 0,
+    'long': 0,
+    'float': 0,
+    'double': 0,
+    'decimal': 0,
+    'string': "SampleString",
+    'bool': True,
+    'DateTime': "2021-01-01T00:00:00Z",
+}
+_LIST_TYPE_PREFIXES = ('List<', 'IList<', 'IEnumerable<', 'ObservableCollection<')
+_CONFIG_CLASS_SUFFIXES = ('Config', 'ConfigObject')
+# Never hold user classes worth documenting: build output, restored packages, VCS metadata and generated code
+_SKIPPED_DIRECTORIES = frozenset(('obj', 'bin', 'packages', '.git', 'node_modules'))
+_GENERATED_FILE_SUFFIXES = ('.g.cs', '.Designer.cs', 'AssemblyInfo.cs')
+_PARALLEL_SCAN_MIN_FILES = 64
+_PARALLEL_SCAN_CHUNKSIZE = 16
+# Files at least this large are scanned through a read-only mmap instead of being copied into bytes.
+# mmap's `in` only tests single bytes, so the extractors use find() for their literal checks.
+_MMAP_MIN_FILE_SIZE = 64 * 1024
+
+def _decode(value):
+    # Match the newline handling of text-mode reads for multi-line captures
+    return value.decode('utf-8').replace('\r\n', '\n')
+
+def _iter_cs_files(directory):
+    """
+    Yields the path of every .cs file under directory, in the same order as os.walk.
+    Build output, package and VCS directories are pruned and generated sources are skipped.
+    """
+    subdirectories = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in _SKIPPED_DIRECTORIES:
+                        subdirectories.append(entry.path)
+                elif name.endswith('.cs') and not name.endswith(_GENERATED_FILE_SUFFIXES) and entry.is_file():
+                    yield entry.path
+    except OSError:
+        return
+    for subdirectory in subdirectories:
+        yield from _iter_cs_files(subdirectory)
 
 def extract_implemented_interfaces(file_content):
-    interface_pattern = re.compile(r'class\s+\w+\s*:\s*([^{]+)')
-    match = interface_pattern.search(file_content)
+    if file_content.find(b'class') == -1:
+        return [], []
+    match = _INTERFACE_RE.search(file_content)
     if match:
-        items = match.group(1).split(',')
-        interfaces = [item.strip() for item in items if item.strip().startswith('I')]
-        base_classes = [item.strip() for item in items if not item.strip().startswith('I') and not item.strip().startswith('EssentialsPluginDeviceFactory')]
+        items = match.group(1).split(b',')
+        interfaces = [_decode(item.strip()) for item in items if item.strip().startswith(b'I')]
+        base_classes = [_decode(item.strip()) for item in items if not item.strip().startswith(b'I') and not item.strip().startswith(b'EssentialsPluginDeviceFactory')]
         return interfaces, base_classes
     return [], []
 
 def extract_supported_types(file_content):
+    # Most files never declare TypeNames; skip the comment-stripping copy for them
+    if file_content.find(b'TypeNames') == -1:
+        return []
+
     # Remove commented lines
-    uncommented_content = re.sub(r'//.*', '', file_content)
-    
-    # Updated regex to match TypeNames initialization
-    types_pattern = re.compile(r'TypeNames\s*=\s*new\s*List<string>\(\)\s*{([^}]+)}')
-    matches = types_pattern.findall(uncommented_content)
+    uncommented_content = _LINE_COMMENT_RE.sub(b'', file_content)
+
+    # Match TypeNames initialization
+    matches = _TYPES_RE.findall(uncommented_content)
     types = []
     for match in matches:
-        current_types = [type_name.strip().strip('"') for type_name in match.split(',')]
+        current_types = [_decode(type_name.strip().strip(b'"')) for type_name in match.split(b',')]
         types.extend(current_types)
 
-    # Remove duplicates and filter out unnecessary entries
-    return list(set(filter(None, types)))
+    # Remove duplicates (keeping declaration order) and filter out unnecessary entries
+    return list(dict.fromkeys(filter(None, types)))
 
-def extract_minimum_essentials_framework_version(file_content):
-    # Update the regex to exclude comments or anything unnecessary.
-    version_pattern = re.compile(r'^\s*MinimumEssentialsFrameworkVersion\s*=\s*"([^"]+)"\s*;', re.MULTILINE)
-    match = version_pattern.search(file_content)
-    if match:
-        return match.group(1)
-    return None
+def extract_source_definitions(file_content):
+    """
+    Tokenizes class headers and the version with one _SOURCE_RE pass, public methods with a separate _METHOD_RE pass.
+    Returns the class header matches, the first minimum framework version and the public methods.
+    """
+    class_matches = []
+    minimum_version = None
+    public_methods = []
+    # Every _SOURCE_RE alternative needs one of these literals
+    if any(file_content.find(literal) != -1 for literal in _SOURCE_LITERALS):
+        for match in _SOURCE_RE.finditer(file_content):
+            if match.lastgroup == 'class_header':
+                class_matches.append(match)
+            elif minimum_version is None:
+                minimum_version = _decode(match.group('version_number'))
+    if file_content.find(b'public') != -1:
+        public_methods = [_decode(method.strip()) for method in _METHOD_RE.findall(file_content)]
+    return class_matches, minimum_version, public_methods
+
+def extract_class_bases(class_matches):
+    class_bases = {}
+    for match in class_matches:
+        class_name = _decode(match.group('class_name'))
+        bases = match.group('class_bases')
+        if bases:
+            base_classes = [_decode(b.strip()) for b in bases.split(b',')]
+        else:
+            base_classes = []
+        class_bases[class_name] = base_classes
+    return class_bases
+
+def extract_class_properties(file_content, class_matches):
+    class_properties = {}
+    for class_match in class_matches:
+        class_name = _decode(class_match.group('class_name'))
+        class_start = class_match.end()
+        # Find the matching closing brace for the class
+        class_body, end_index = extract_class_body(file_content, class_start)
+        # Parse properties within the class body
+        properties = []
+        for prop_match in _PROPERTY_RE.finditer(class_body):
+            prop_string = prop_match.group(0)
+            json_property_match = _JSON_PROPERTY_RE.search(prop_string) if b'JsonProperty' in prop_string else None
+            json_property_name = _decode(json_property_match.group(1)) if json_property_match else None
+            prop_type = _decode(prop_match.group(1).strip())
+            prop_name = _decode(prop_match.group(2))
+            properties.append({
+                "json_property_name": json_property_name if json_property_name else prop_name,
+                "property_name": prop_name,
+                "property_type": prop_type
+            })
+        class_properties[class_name] = properties
+    return class_properties
+
+def extract_join_rows(file_content):
+    # Each join is emitted as a (join_type, chart_row) pair ready for generate_markdown_chart
+    join_rows = []
+    if file_content.find(b'JoinDataComplete') == -1:
+        return join_rows
+    # Start the scan at the first attribute so the header of the file is never visited
+    first_join = file_content.find(b'[JoinName("')
+    if first_join == -1:
+        return join_rows
+    append_row = join_rows.append
+    for match in _JOIN_RE.finditer(file_content, first_join):
+        # Search join_data and join_metadata in place via their spans rather than copying them out
+        data_start, data_end = match.span('join_data')
+        metadata_start, metadata_end = match.span('join_metadata')
 
-def extract_public_methods(file_content):
-    methods_pattern = re.compile(r'public\s+\w+\s+\w+\s*\([^)]*\)\s*')
-    matches = methods_pattern.findall(file_content)
-    return [match.strip() for match in matches]
+        # Extract join_number from join_data
+        join_number_match = _JOIN_NUMBER_RE.search(file_content, data_start, data_end)
+        if join_number_match:
+            join_number = _decode(join_number_match.group(1))
+        else:
+            join_number = None
+
+        # Extract description and join_type from join_metadata in one pass, keeping the first of each
+        metadata = {}
+        for field_match in _JOIN_METADATA_RE.finditer(file_content, metadata_start, metadata_end):
+            field = field_match.lastgroup
+            if field not in metadata:
+                metadata[field] = _decode(field_match.group(field))
+                if len(metadata) == 2:
+                    break
+        description = metadata.get('description')
+        join_type = metadata.get('join_type')
+
+        append_row((join_type, f"| {join_number} | R | {description} |\n"))
 
-def read_files_in_directory(directory):
+    return join_rows
+
+def _scan_file(file_path):
+    """
+    Reads a single .cs file and runs all extractors over its content.
+    Kept at module level so it can be dispatched to worker processes.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_FILE_SIZE:
+            return _scan_content(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return _scan_content(content)
+
+def _scan_content(content):
+    """
+    Runs all extractors over the content of one file, given as bytes or a read-only mmap.
+    """
+    interfaces, base_classes = extract_implemented_interfaces(content)
+    supported_types = extract_supported_types(content)
+    class_matches, minimum_version, public_methods = extract_source_definitions(content)
+    class_bases = extract_class_bases(class_matches)
+    joinmap_classes = [class_name for class_name, bases in class_bases.items() if 'JoinMapBaseAdvanced' in bases]
+    class_properties = extract_class_properties(content, class_matches)
+    join_rows = extract_join_rows(content)
+    return interfaces, base_classes, supported_types, minimum_version, public_methods, joinmap_classes, class_properties, join_rows
+
+def _merge_file_results(file_paths, file_results):
     all_interfaces = []
     all_base_classes = []
-    all_supported_types = []
-    all_minimum_versions = []
     all_public_methods = []
-    all_joins = []
-
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.cs'):
-                file_path = os.path.join(root, file)
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    interfaces, base_classes = extract_implemented_interfaces(content)
-                    supported_types = extract_supported_types(content)
-                    minimum_version = extract_minimum_essentials_framework_version(content)
-                    public_methods = extract_public_methods(content)
-
-                    all_interfaces.extend(interfaces)
-                    all_base_classes.extend(base_classes)
-                    all_supported_types.extend(supported_types)
-                    if minimum_version:
-                        all_minimum_versions.append(minimum_version)
-                    all_public_methods.extend(public_methods)
+    # Dicts used as ordered sets, so values repeated across files are listed once
+    all_supported_types = {}
+    all_minimum_versions = {}
+    all_joinmap_classes = {}
+    all_config_classes = {}
+    all_class_properties = {}
+    # Join rows are kept per file so join maps never need a second read
+    all_join_rows = {}
+
+    for file_path, (interfaces, base_classes, supported_types, minimum_version, public_methods, joinmap_classes, class_properties, join_rows) in zip(file_paths, file_results):
+        all_interfaces.extend(interfaces)
+        all_base_classes.extend(base_classes)
+        all_supported_types.update(dict.fromkeys(supported_types))
+        if minimum_version:
+            all_minimum_versions[minimum_version] = None
+        all_public_methods.extend(public_methods)
+        all_joinmap_classes.update(dict.fromkeys(joinmap_classes))
+        all_config_classes.update(dict.fromkeys(cls for cls in class_properties if cls.endswith(_CONFIG_CLASS_SUFFIXES)))
+        all_class_properties.update(class_properties)
+        if join_rows:
+            all_join_rows[file_path] = join_rows
 
     return {
         "interfaces": all_interfaces,
         "base_classes": all_base_classes,
-        "supported_types": all_supported_types,
-        "minimum_versions": all_minimum_versions,
-        "public_methods": all_public_methods
+        "supported_types": list(all_supported_types),
+        "minimum_versions": list(all_minimum_versions),
+        "public_methods": all_public_methods,
+        "joinmap_classes": list(all_joinmap_classes),
+        "config_classes": list(all_config_classes),
+        "class_properties": all_class_properties,
+        "join_rows": all_join_rows
     }
 
-def read_class_names_and_bases_from_files(directory):
-    class_defs = {}
-    class_pattern = re.compile(
-        r'^\s*(?:\[[^\]]+\]\s*)*'        # Optional attributes
-        r'(?:public\s+|private\s+|protected\s+)?'  # Optional access modifier
-        r'(?:partial\s+)?'                # Optional 'partial' keyword
-        r'class\s+([A-Za-z_]\w*)'         # Class name
-        r'(?:\s*:\s*([^\{]+))?'           # Optional base classes
-        r'\s*\{',                         # Opening brace
-        re.MULTILINE
-    )
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.cs'):
-                file_path = os.path.join(root, file)
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    for match in class_pattern.finditer(content):
-                        class_name = match.group(1)
-                        bases = match.group(2)
-                        if bases:
-                            base_classes = [b.strip() for b in bases.split(',')]
-                        else:
-                            base_classes = []
-                        class_defs[class_name] = base_classes
-    return class_defs
-
-def find_joinmap_classes(class_defs):
-    joinmap_classes = []
-    for class_name, base_classes in class_defs.items():
-        if 'JoinMapBaseAdvanced' in base_classes:
-            joinmap_classes.append(class_name)
-    return joinmap_classes
-
-def find_file_in_directory(filename, root_directory):
-    for root, _, files in os.walk(root_directory):
-        for file in files:
-            if file == filename:
-                full_path = os.path.join(root, file)
-                return full_path
-    return None
+def scan_project(directory):
+    """
+    Reads every .cs file under directory once and runs all extractors over its content.
+    Large projects on multi-core machines are scanned in worker processes, everything else
+    serially; results are merged in walk order either way.
+
+    Parameters:
+    - directory (str): The project root to scan.
+
+    Returns:
+    - dict: The combined results of every extractor across all files.
+    """
+    file_paths = list(_iter_cs_files(directory))
+    file_index = {}
+    for file_path in file_paths:
+        # Keep the first path seen for each file name
+        file_index.setdefault(os.path.basename(file_path), file_path)
+
+    if len(file_paths) >= _PARALLEL_SCAN_MIN_FILES and (os.cpu_count() or 1) > 1:
+        # Imported here so small projects never pay for loading concurrent.futures and multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor() as executor:
+            results = _merge_file_results(file_paths, executor.map(_scan_file, file_paths, chunksize=_PARALLEL_SCAN_CHUNKSIZE))
+    else:
+        # Not worth the process start-up cost for small projects or on a single core; the work is
+        # GIL-bound regex matching over page-cached files, so threads would only add overhead
+        results = _merge_file_results(file_paths, [_scan_file(file_path) for file_path in file_paths])
+    results["file_index"] = file_index
+    return results
 
-def parse_joinmap_info(class_name, root_directory):
+def parse_joinmap_info(class_name, file_index, join_rows):
     filename = f"{class_name}.cs"
-    file_path = find_file_in_directory(filename, root_directory)
+    file_path = file_index.get(filename)
 
     if not file_path:
         print(f"File not found: {filename}. Skipping...")
         return []
 
-    with open(file_path, 'r', encoding='utf-8') as file:
-        file_content = file.read()
-
-    join_pattern = re.compile(
-        r'\[JoinName\("(?P<join_name>[^"]+)"\)\]\s*'  # Match the [JoinName("...")] attribute
-        r'public\s+JoinDataComplete\s+(?P<property_name>\w+)\s*=\s*'  # Match the property declaration
-        r'new\s+JoinDataComplete\s*\('  # Match 'new JoinDataComplete('
-        r'\s*new\s+JoinData\s*\{(?P<join_data>[^\}]+)\}\s*,'  # Match 'new JoinData { ... },'
-        r'\s*new\s+JoinMetadata\s*\{(?P<join_metadata>[^\}]+)\}\s*'  # Match 'new JoinMetadata { ... }'
-        r'\)',  # Match closing parenthesis of new JoinDataComplete
-        re.DOTALL
-    )
-
-    joinmap_info = []
-    for match in join_pattern.finditer(file_content):
-        join_name = match.group('join_name')
-        property_name = match.group('property_name')
-        join_data = match.group('join_data')
-        join_metadata = match.group('join_metadata')
-
-        # Now parse join_data and join_metadata to extract join_number, description, join_type, etc.
-
-        # Extract join_number from join_data
-        join_number_match = re.search(r'JoinNumber\s*=\s*(\d+)', join_data)
-        if join_number_match:
-            join_number = join_number_match.group(1)
-        else:
-            join_number = None
-
-        # Extract description and join_type from join_metadata
-        description_match = re.search(r'Description\s*=\s*"([^"]+)"', join_metadata)
-        if description_match:
-            description = description_match.group(1)
-        else:
-            description = None
-
-        join_type_match = re.search(r'JoinType\s*=\s*eJoinType\.(\w+)', join_metadata)
-        if join_type_match:
-            join_type = join_type_match.group(1)
-        else:
-            join_type = None
-
-        joinmap_info.append({
-            "name": join_name,
-            "join_number": join_number,
-            "type": join_type,
-            "description": description
-        })
-
-    return joinmap_info
+    return join_rows.get(file_path, [])
 
 def generate_markdown_chart(joins, section_title):
     if not joins:
         return ''
-    markdown_chart = f'### {section_title}\n\n'
-
-    # Group joins by type
-    joins_by_type = {'Digital': [], 'Analog': [], 'Serial': []}
-    for join in joins:
-        if join['type'] in joins_by_type:
-            joins_by_type[join['type']].append(join)
-        else:
-            joins_by_type['Digital'].append(join)  # Default to Digital if type not recognized
-
-    for join_type in ['Digital', 'Analog', 'Serial']:
-        if joins_by_type[join_type]:
-            markdown_chart += f"#### {join_type}s\n\n"
-            markdown_chart += "| Join | Type (RW) | Description |\n"
-            markdown_chart += "| --- | --- | --- |\n"
-            for join in joins_by_type[join_type]:
-                markdown_chart += f"| {join['join_number']} | R | {join['description']} |\n"
-            markdown_chart += '\n'
-    return markdown_chart
+    # Group join rows by type in a single pass
+    rows_by_type = {'Digital': [], 'Analog': [], 'Serial': []}
+    digital_rows = rows_by_type['Digital']
+    for join_type, row in joins:
+        # Default to Digital if type not recognized
+        rows_by_type.get(join_type, digital_rows).append(row)
+
+    parts = [f'### {section_title}\n\n']
+    for join_type, rows in rows_by_type.items():
+        if rows:
+            parts.append(f"#### {join_type}s\n\n")
+            parts.append("| Join | Type (RW) | Description |\n")
+            parts.append("| --- | --- | --- |\n")
+            parts.extend(rows)
+            parts.append('\n')
+    return ''.join(parts)
 
 def generate_config_example_markdown(sample_config):
-    markdown = "### Config Example\n\n"
-    markdown += "```json\n"
-    markdown += json.dumps(sample_config, indent=4)
-    markdown += "\n```\n"
-    return markdown
+    return ''.join(("### Config Example\n\n", "```json\n", json.dumps(sample_config, indent=4), "\n```\n"))
 
 def generate_markdown_list(items, section_title):
     """
@@ -218,60 +390,10 @@ def generate_markdown_list(items, section_title):
     """
     if not items:
         return ''
-    markdown = f'### {section_title}\n\n'
-    for item in items:
-        markdown += f"- {item}\n"
-    markdown += '\n'
-    return markdown
-
-def parse_all_classes(directory):
-    class_defs = {}
-    class_pattern = re.compile(
-        r'^\s*(?:\[[^\]]+\]\s*)*'      # Optional attributes
-        r'(?:public\s+|private\s+|protected\s+)?'  # Access modifier
-        r'(?:partial\s+)?'                # Optional 'partial' keyword
-        r'class\s+([A-Za-z_]\w*)'       # Class name
-        r'(?:\s*:\s*[^\{]+)?'           # Optional inheritance
-        r'\s*\{',                       # Opening brace
-        re.MULTILINE
-    )
-    property_pattern = re.compile(
-        r'^\s*'
-        r'(?:\[[^\]]*\]\s*)*'              # Optional attributes
-        r'(?:public|private|protected)\s+'  # Access modifier
-        r'(?:static\s+|virtual\s+|override\s+|abstract\s+|readonly\s+)?'  # Optional modifiers
-        r'([A-Za-z0-9_<>,\s\[\]\?]+?)\s+'     # Type
-        r'([A-Za-z_]\w*)\s*'                # Property name
-        r'\{[^}]*?\}',                      # Property body
-        re.MULTILINE | re.DOTALL
-    )
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.cs'):
-                file_path = os.path.join(root, file)
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Find all class definitions
-                    for class_match in class_pattern.finditer(content):
-                        class_name = class_match.group(1)
-                        class_start = class_match.end()
-                        # Find the matching closing brace for the class
-                        class_body, end_index = extract_class_body(content, class_start)
-                        # Parse properties within the class body
-                        properties = []
-                        for prop_match in property_pattern.finditer(class_body):
-                            prop_string = prop_match.group(0)
-                            json_property_match = re.search(r'\[JsonProperty\("([^"]+)"\)\]', prop_string)
-                            json_property_name = json_property_match.group(1) if json_property_match else None
-                            prop_type = prop_match.group(1).strip()
-                            prop_name = prop_match.group(2)
-                            properties.append({
-                                "json_property_name": json_property_name if json_property_name else prop_name,
-                                "property_name": prop_name,
-                                "property_type": prop_type
-                            })
-                        class_defs[class_name] = properties
-    return class_defs
+    parts = [f'### {section_title}\n\n']
+    parts.extend(f"- {item}\n" for item in items)
+    parts.append('\n')
+    return ''.join(parts)
 
 def extract_class_body(content, start_index):
     """
@@ -279,53 +401,70 @@ def extract_class_body(content, start_index):
     Returns the class body and the index where it ends.
     """
     brace_count = 1
-    index = start_index
-    while brace_count > 0 and index < len(content):
-        if content[index] == '{':
+    for match in _BRACE_RE.finditer(content, start_index):
+        token = match.lastgroup
+        if token == 'open':
             brace_count += 1
-        elif content[index] == '}':
+        elif token == 'close':
             brace_count -= 1
-        index += 1
-    return content[start_index:index - 1], index - 1
+            if brace_count == 0:
+                end_index = match.start()
+                return content[start_index:end_index], end_index
+    # Unbalanced braces, the body runs to the end of the content
+    end_index = len(content) - 1
+    return content[start_index:end_index], end_index
+
+@functools.lru_cache(maxsize=None)
+def _parse_collection_type(property_type):
+    """
+    Splits a collection type into its kind ('list' or 'dict') and inner types.
+    Returns None for anything that is not a supported collection.
+    """
+    if property_type.startswith(_LIST_TYPE_PREFIXES):
+        inner_type = property_type[property_type.find('<')+1:-1]
+        return 'list', (inner_type,)
+    if property_type.startswith('Dictionary<'):
+        types = property_type[property_type.find('<')+1:-1].split(',')
+        return 'dict', (types[0].strip(), types[1].strip())
+    return None
 
-def generate_sample_value(property_type, class_defs, processed_classes=None):
+def generate_sample_value(property_type, class_defs, processed_classes=None, sample_cache=None):
     if processed_classes is None:
-        processed_classes = set()
+        # Classes currently being expanded, outermost first
+        processed_classes = ()
+    if sample_cache is None:
+        sample_cache = {}
     property_type = property_type.strip()
     # Handle nullable types
     property_type = property_type.rstrip('?')
     # Handle primitive types
-    if property_type in ('int', 'long', 'float', 'double', 'decimal'):
-        return 0
-    elif property_type == 'string':
-        return "SampleString"
-    elif property_type == 'bool':
-        return True
-    elif property_type == 'DateTime':
-        return "2021-01-01T00:00:00Z"
+    if property_type in _PRIMITIVE_SAMPLES:
+        return _PRIMITIVE_SAMPLES[property_type]
     # Handle collections
-    elif property_type.startswith('List<') or property_type.startswith('IList<') or property_type.startswith('IEnumerable<') or property_type.startswith('ObservableCollection<'):
-        inner_type = property_type[property_type.find('<')+1:-1]
-        return [generate_sample_value(inner_type, class_defs, processed_classes)]
-    elif property_type.startswith('Dictionary<'):
-        types = property_type[property_type.find('<')+1:-1].split(',')
-        key_type = types[0].strip()
-        value_type = types[1].strip()
-        key_sample = generate_sample_value(key_type, class_defs, processed_classes)
-        value_sample = generate_sample_value(value_type, class_defs, processed_classes)
+    collection = _parse_collection_type(property_type)
+    if collection is not None:
+        kind, inner_types = collection
+        if kind == 'list':
+            return [generate_sample_value(inner_types[0], class_defs, processed_classes, sample_cache)]
+        key_sample = generate_sample_value(inner_types[0], class_defs, processed_classes, sample_cache)
+        value_sample = generate_sample_value(inner_types[1], class_defs, processed_classes, sample_cache)
         return { key_sample: value_sample }
     # Handle custom classes
     elif property_type in class_defs:
         if property_type in processed_classes:
             return {}
-        processed_classes.add(property_type)
+        # A class sample only depends on which classes are already being expanded
+        cache_key = (property_type, frozenset(processed_classes))
+        if cache_key in sample_cache:
+            return copy.deepcopy(sample_cache[cache_key])
+        nested_classes = processed_classes + (property_type,)
         properties = class_defs[property_type]
         sample_obj = {}
         for prop in properties:
             prop_name = prop['json_property_name']
             prop_type = prop['property_type']
-            sample_obj[prop_name] = generate_sample_value(prop_type, class_defs, processed_classes)
-        processed_classes.remove(property_type)
+            sample_obj[prop_name] = generate_sample_value(prop_type, class_defs, nested_classes, sample_cache)
+        sample_cache[cache_key] = sample_obj
         return sample_obj
     else:
         # Unknown type, default to a sample value
@@ -352,66 +491,98 @@ def read_readme_file(filepath):
     with open(filepath, 'r', encoding='utf-8') as f:
         return f.read()
 
-def update_readme_section(readme_content, section_title, new_section_content):
+@functools.lru_cache(maxsize=None)
+def _section_pattern(section_title):
     start_marker = f'<!-- START {section_title} -->'
     end_marker = f'<!-- END {section_title} -->'
-
-    pattern = re.compile(
+    return re.compile(
         rf'{re.escape(start_marker)}(.*?){re.escape(end_marker)}',
         re.DOTALL | re.IGNORECASE
     )
 
-    match = pattern.search(readme_content)
+def update_readme_sections(readme_content, sections):
+    """
+    Updates or appends several README sections.
+    Each title is searched on its own in the original text; when the found sections do not
+    overlap they are spliced in a single join, otherwise the updates are applied one at a time.
+    Missing sections are appended in the given order.
 
-    if match:
-        section_content = match.group(1)
-        if '<!-- SKIP -->' in section_content:
-            print(f"Skipping section: {section_title} (found <!-- SKIP -->)")
-            return readme_content  # Return the original content unchanged
+    Parameters:
+    - readme_content (str): The README text.
+    - sections (list): (section_title, new_section_content) pairs.
+
+    Returns:
+    - str: The updated README text.
+    """
+    section_matches = [_section_pattern(section_title).search(readme_content) for section_title, _ in sections]
+    spans = sorted(match.span() for match in section_matches if match)
+    if any(previous_end > start for (_, previous_end), (start, _) in zip(spans, spans[1:])):
+        # One section's span contains another's (e.g. after a stray START marker), so each
+        # update has to see the text left by the previous one
+        for section in sections:
+            readme_content = update_readme_sections(readme_content, [section])
+        return readme_content
+
+    replacements = []
+    new_sections = []
+    for (section_title, new_section_content), match in zip(sections, section_matches):
+        start_marker = f'<!-- START {section_title} -->'
+        end_marker = f'<!-- END {section_title} -->'
+        if match:
+            if '<!-- SKIP -->' in match.group(1):
+                print(f"Skipping section: {section_title} (found <!-- SKIP -->)")
+            else:
+                print(f"Updating existing section: {section_title}")
+                updated_section = f'{start_marker}\n{new_section_content.rstrip()}\n{end_marker}'
+                replacements.append((match.start(), match.end(), updated_section))
         else:
-            print(f"Updating existing section: {section_title}")
-            updated_section = f'{start_marker}\n{new_section_content.rstrip()}\n{end_marker}'
-            updated_readme = readme_content[:match.start()] + updated_section + readme_content[match.end():]
-    else:
-        print(f"Adding new section: {section_title}")
-        # Ensure there's a newline before adding the new section
-        if not readme_content.endswith('\n'):
-            readme_content += '\n'
-        updated_section = f'{start_marker}\n{new_section_content.rstrip()}\n{end_marker}\n'
-        updated_readme = readme_content + updated_section
+            print(f"Adding new section: {section_title}")
+            new_sections.append(f'{start_marker}\n{new_section_content.rstrip()}\n{end_marker}\n')
+
+    parts = []
+    position = 0
+    for start, end, updated_section in sorted(replacements):
+        parts.append(readme_content[position:start])
+        parts.append(updated_section)
+        position = end
+    parts.append(readme_content[position:])
+    updated_readme = ''.join(parts)
+    if new_sections:
+        # Ensure there's a newline before adding the new sections
+        if not updated_readme.endswith('\n'):
+            updated_readme += '\n'
+        updated_readme += ''.join(new_sections)
     return updated_readme
 
 def remove_duplicates_preserve_order(seq):
-    seen = set()
-    return [x for x in seq if not (x in seen or seen.add(x))]
+    return list(dict.fromkeys(seq))
 
 if __name__ == "__main__":
     project_directory = os.path.abspath("./")
-    results = read_files_in_directory(project_directory)
+    results = scan_project(project_directory)
 
-    # Remove duplicates from interfaces and base classes while preserving order
+    # Remove duplicates from interfaces, base classes and public methods while preserving order
     unique_interfaces = remove_duplicates_preserve_order(results["interfaces"])
     unique_base_classes = remove_duplicates_preserve_order(results["base_classes"])
+    unique_public_methods = remove_duplicates_preserve_order(results["public_methods"])
 
     # Generate markdown sections with titles using the deduplicated lists
     interfaces_markdown = generate_markdown_list(unique_interfaces, "Interfaces Implemented")
     base_classes_markdown = generate_markdown_list(unique_base_classes, "Base Classes")
     supported_types_markdown = generate_markdown_list(results["supported_types"], "Supported Types")
     minimum_versions_markdown = generate_markdown_list(results["minimum_versions"], "Minimum Essentials Framework Versions")
-    public_methods_markdown = generate_markdown_list(results["public_methods"], "Public Methods")
+    public_methods_markdown = generate_markdown_list(unique_public_methods, "Public Methods")
 
     # Generate Join Maps markdown
-    class_defs = read_class_names_and_bases_from_files(project_directory)
-    joinmap_classes = find_joinmap_classes(class_defs)
     joinmap_info = []
-    for cls in joinmap_classes:
-        info = parse_joinmap_info(cls, project_directory)
+    for cls in results["joinmap_classes"]:
+        info = parse_joinmap_info(cls, results["file_index"], results["join_rows"])
         joinmap_info.extend(info)
     join_maps_markdown = generate_markdown_chart(joinmap_info, "Join Maps")
 
     # Generate Config Example markdown
-    all_class_defs = parse_all_classes(project_directory)
-    config_classes = [cls for cls in all_class_defs if cls.endswith('Config') or cls.endswith('ConfigObject')]
+    all_class_defs = results["class_properties"]
+    config_classes = results["config_classes"]
     if not config_classes:
         print("No config classes found.")
         config_example_markdown = ""
@@ -425,14 +596,17 @@ if __name__ == "__main__":
     readme_content = read_readme_file(readme_path)
 
     # Update or insert sections with section titles handled in the content
-    readme_content = update_readme_section(readme_content, "Interfaces Implemented", interfaces_markdown)
-    readme_content = update_readme_section(readme_content, "Base Classes", base_classes_markdown)
-    readme_content = update_readme_section(readme_content, "Supported Types", supported_types_markdown)
-    readme_content = update_readme_section(readme_content, "Minimum Essentials Framework Versions", minimum_versions_markdown)
-    readme_content = update_readme_section(readme_content, "Public Methods", public_methods_markdown)
-    readme_content = update_readme_section(readme_content, "Join Maps", join_maps_markdown)
+    sections = [
+        ("Interfaces Implemented", interfaces_markdown),
+        ("Base Classes", base_classes_markdown),
+        ("Supported Types", supported_types_markdown),
+        ("Minimum Essentials Framework Versions", minimum_versions_markdown),
+        ("Public Methods", public_methods_markdown),
+        ("Join Maps", join_maps_markdown),
+    ]
     if config_example_markdown:
-        readme_content = update_readme_section(readme_content, "Config Example", config_example_markdown)
+        sections.append(("Config Example", config_example_markdown))
+    readme_content = update_readme_sections(readme_content, sections)
 
     # Write the updated content back to README.md
     with open(readme_path, 'w', encoding='utf-8') as f: